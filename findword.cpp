@@ -7,7 +7,6 @@
 #include <exception>
 #include <ranges>
 #include <coroutine>
-#include <valarray>
 #include <algorithm>
 #include <chrono>
 #include <thread>
@@ -76,25 +75,16 @@ int main(int argc, char* argv[])
 	auto wordfinder = [](std::string_view word) -> generator<std::string>
 	{
 		const auto SIZE = word.size();
-		std::valarray<size_t> indices(size_t(0), SIZE);
-		for (auto i : std::ranges::views::iota(size_t(0), SIZE))
-			indices[i] = i;
-		auto index_to_iterator = [&](size_t i) { return std::ranges::next(word.begin(), i); };
+		// permute the sorted letters themselves, so that repeated letters
+		// make std::next_permutation skip identical arrangements
+		std::string letters{ word };
+		std::ranges::sort(letters);
 		do
 		{
 			for (auto i : std::ranges::views::iota(size_t(2), SIZE))
-			{
-				std::string permutated_word{};
-				permutated_word.reserve(SIZE);
-				for (auto j : std::ranges::views::iota(size_t(0), i))
-					permutated_word.push_back(*index_to_iterator(indices[j]));
-				co_yield permutated_word;
-			}
-			std::string last_permutated_word{};
-			for (auto& idx : indices)
-				last_permutated_word.push_back(*index_to_iterator(idx));
-			co_yield last_permutated_word;
-	    } while (std::next_permutation(std::ranges::begin(indices), std::ranges::end(indices)));
+				co_yield letters.substr(0, i);
+			co_yield letters;
+	    } while (std::next_permutation(std::ranges::begin(letters), std::ranges::end(letters)));
     };
 	std::ofstream ofile{};
 	try
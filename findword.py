@@ -1,18 +1,22 @@
+import sys
+
 from spellchecker import SpellChecker
 
 # Initialize the spellchecker
 spell = SpellChecker()
 
-# Read permutations from the file
-with open("permutated_words.txt", "r") as file:
-    permutations = file.read().splitlines()
+# Check which words are valid against the frequency dictionary directly,
+# bypassing the per-word SpellChecker.__contains__ dispatch
+dictionary = spell.word_frequency.dictionary
 
-# Check which words are valid
-valid_words = [word for word in permutations if word in spell]
+# Stream permutations from the file so only the valid words are kept in memory
+with open("permutated_words.txt", "r") as file:
+    valid_words = [word for word in (line.rstrip("\n") for line in file) if word.lower() in dictionary]
 
 # Write valid words to a new file
 # with open("valid_words.txt", "w") as output_file:
 #    for word in valid_words:
 #        output_file.write(word + "\n")
-for word in valid_words:
-    print(word)
\ No newline at end of file
+# Print all valid words with a single write
+if valid_words:
+    sys.stdout.write("\n".join(valid_words) + "\n")
\ No newline at end of file
@@ -7,6 +7,7 @@ Modern Python script replacing traditional shell scripts
 import subprocess
 import sys
 import os
+import shutil
 import platform
 import json
 from pathlib import Path
@@ -32,26 +33,15 @@ class CrossPlatformRunner:
         
     def _get_python_command(self) -> str:
         """Get the appropriate Python command for the platform"""
-        commands = ["python3", "python"]
-        for cmd in commands:
-            try:
-                result = subprocess.run([cmd, "--version"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    return cmd
-            except FileNotFoundError:
-                continue
-        raise RuntimeError("Python not found in PATH")
+        if sys.executable:
+            return sys.executable
+        raise RuntimeError("Python executable not found")
     
     def _get_cmake_command(self) -> str:
         """Get the appropriate CMake command"""
-        try:
-            result = subprocess.run(["cmake", "--version"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                return "cmake"
-        except FileNotFoundError:
-            pass
+        cmake = shutil.which("cmake")
+        if cmake:
+            return cmake
         raise RuntimeError("CMake not found in PATH")
     
     def run_command(self, command: List[str], cwd: str = None, 
@@ -161,7 +151,6 @@ class CrossPlatformRunner:
         print(f"{Colors.YELLOW}Cleaning project...{Colors.NC}")
         
         # Remove build directories
-        import shutil
         dirs_to_remove = ["build", "venv"]
         for dir_name in dirs_to_remove:
             if os.path.exists(dir_name):
@@ -171,11 +160,15 @@ class CrossPlatformRunner:
         # Remove temporary files
         files_to_remove = ["permutated_words.txt", "*.exe", "findword"]
         for pattern in files_to_remove:
-            import glob
-            for file in glob.glob(pattern):
-                if os.path.exists(file):
-                    os.remove(file)
-                    print(f"Removed {file}")
+            for file in Path(".").glob(pattern):
+                # Path.glob matches dotfiles, unlike glob.glob
+                if file.name.startswith("."):
+                    continue
+                try:
+                    file.unlink()
+                except FileNotFoundError:
+                    continue
+                print(f"Removed {file}")
         
         print(f"{Colors.GREEN}Cleaning complete{Colors.NC}")
     
@@ -189,14 +182,9 @@ class CrossPlatformRunner:
         # Check for C++ compiler
         compilers = ["g++", "clang++", "cl"]
         for compiler in compilers:
-            try:
-                result = subprocess.run([compiler, "--version"], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"C++ Compiler: {compiler}")
-                    break
-            except FileNotFoundError:
-                continue
+            if shutil.which(compiler):
+                print(f"C++ Compiler: {compiler}")
+                break
 
 def main():
     """Main entry point"""
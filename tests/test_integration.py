@@ -8,9 +8,19 @@ import subprocess
 import sys
 import os
 import json
+import functools
+import re
 from pathlib import Path
 from typing import List, Dict, Any
 
+_WORD_RE = re.compile(r"\S+")
+
+@functools.lru_cache(maxsize=1)
+def _spell():
+    """Load the spellchecker dictionary once per test run"""
+    import spellchecker
+    return spellchecker.SpellChecker()
+
 class TestRunner:
     def __init__(self):
         self.passed = 0
@@ -65,8 +75,7 @@ class FindWordTester:
             raise Exception(f"Non-zero exit code: {code}, stderr: {stderr}")
         
         # Should find at least the word TEST itself
-        lines = stdout.strip().split('\n')
-        words = [line.strip() for line in lines if line.strip()]
+        words = _WORD_RE.findall(stdout)
         
         if not words:
             raise Exception("No words found in output")
@@ -81,8 +90,7 @@ class FindWordTester:
         if code != 0:
             raise Exception(f"Non-zero exit code: {code}, stderr: {stderr}")
         
-        lines = stdout.strip().split('\n')
-        words = [line.strip() for line in lines if line.strip()]
+        words = _WORD_RE.findall(stdout)
         
         expected_words = ["LISTEN", "SILENT"]
         found_expected = [word for word in expected_words if word in words]
@@ -97,8 +105,7 @@ class FindWordTester:
         if code != 0:
             raise Exception(f"Non-zero exit code: {code}, stderr: {stderr}")
         
-        lines = stdout.strip().split('\n')
-        words = [line.strip() for line in lines if line.strip()]
+        words = _WORD_RE.findall(stdout)
         
         if "CAT" not in words:
             raise Exception("Original word 'CAT' not found in output")
@@ -120,9 +127,8 @@ class FindWordTester:
     def test_python_environment(self):
         """Test that Python environment is properly set up"""
         try:
-            import spellchecker
             # Test basic functionality of spellchecker
-            spell = spellchecker.SpellChecker()
+            spell = _spell()
             test_words = ["hello", "world", "asdfghjkl"]
             valid_words = [word for word in test_words if word in spell]
             